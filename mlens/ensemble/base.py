@@ -20,18 +20,12 @@ from .. import config
 from ..parallel import Layer, ParallelProcessing, make_group
 from ..parallel.base import BaseStacker
 from ..externals.sklearn.validation import check_random_state
-from ..utils import (check_ensemble_build, print_time,
-                     safe_print, IdTrain, format_name)
+from ..utils import (check_ensemble_build, safe_print, _Timed,
+                     IdTrain, format_name)
 from ..utils.exceptions import (
     LayerSpecificationWarning, NotFittedError, NotInitializedError)
 from ..metrics import Data
 from ..externals.sklearn.base import BaseEstimator, clone
-try:
-    # Try get performance counter
-    from time import perf_counter as time
-except ImportError:
-    # Fall back on wall clock
-    from time import time
 
 
 GLOBAL_SEQUENTIAL_NAME = list()
@@ -70,9 +64,7 @@ def print_job(lc, start_message):
 [INFO] cache = %r
 """ % (lc.n_jobs, lc.backend, config.get_start_method(), config.get_tmpdir()),
                        file=f, flush=True)
-
-    t0 = time()
-    return f, t0
+    return f
 
 
 ###############################################################################
@@ -151,14 +143,12 @@ class Sequential(BaseStacker):
         if not self.__stack__:
             raise NotInitializedError("No elements in stack to fit.")
 
-        f, t0 = print_job(self, "Fitting")
-
-        with ParallelProcessing(self.backend, self.n_jobs,
-                                max(self.verbose - 4, 0)) as manager:
-            out = manager.stack(self, 'fit', X, y, **kwargs)
+        f = print_job(self, "Fitting")
 
-        if self.verbose:
-            print_time(t0, "{:<35}".format("Fit complete"), file=f)
+        with _Timed(self.verbose, "{:<35}".format("Fit complete"), file=f):
+            with ParallelProcessing(self.backend, self.n_jobs,
+                                    max(self.verbose - 4, 0)) as manager:
+                out = manager.stack(self, 'fit', X, y, **kwargs)
 
         if out is None:
             return self
@@ -201,13 +191,11 @@ class Sequential(BaseStacker):
         if not self.__fitted__:
             NotFittedError("Instance not fitted.")
 
-        f, t0 = print_job(self, "Predicting")
+        f = print_job(self, "Predicting")
 
-        out = self._predict(X, 'predict', **kwargs)
-
-        if self.verbose:
-            print_time(t0, "{:<35}".format("Predict complete"),
-                       file=f, flush=True)
+        with _Timed(self.verbose, "{:<35}".format("Predict complete"),
+                    file=f, flush=True):
+            out = self._predict(X, 'predict', **kwargs)
         return out
 
     def transform(self, X, **kwargs):
@@ -232,13 +220,11 @@ class Sequential(BaseStacker):
         if not self.__fitted__:
             NotFittedError("Instance not fitted.")
 
-        f, t0 = print_job(self, "Transforming")
+        f = print_job(self, "Transforming")
 
-        out = self._predict(X, 'transform', **kwargs)
-
-        if self.verbose:
-            print_time(t0, "{:<35}".format("Transform complete"),
-                       file=f, flush=True)
+        with _Timed(self.verbose, "{:<35}".format("Transform complete"),
+                    file=f, flush=True):
+            out = self._predict(X, 'transform', **kwargs)
 
         return out
 
@@ -22,3 +22,15 @@ def redirect(target, file=sys.stderr):
         yield target
     finally:
         file = original
+
+
+def lru_cache(maxsize=128):
+    """Replication of ``functools.lru_cache`` signature without caching.
+
+    Used on Python 2, where the decorated function is returned unchanged.
+    """
+    # pylint: disable=unused-argument
+    def decorator(func):
+        """Return function as is"""
+        return func
+    return decorator
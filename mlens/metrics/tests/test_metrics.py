@@ -27,3 +27,44 @@ def test_wape():
     """[Metrics] mape."""
     z = metrics.wape(y, p)
     np.testing.assert_equal(np.array(z), np.array(3.7))
+
+
+def test_assemble_data():
+    """[Metrics] assemble_data."""
+    d = [('layer/case.est.0.%i' % i, {'score': i, 'ft': None})
+         for i in range(1, 4)]
+    d.append(('layer/est.0.1', {'score': None, 'ft': 2.}))
+    data = metrics.assemble_data(d)
+    assert list(data) == ['score-m', 'score-s', 'ft-m', 'ft-s']
+    np.testing.assert_equal(data['score-m']['layer/case.est'], 2.)
+    np.testing.assert_equal(data['score-s']['layer/case.est'],
+                            np.std([1, 2, 3]))
+    assert data['score-m']['layer/est'] == []
+    assert data['ft-m']['layer/case.est'] == []
+    np.testing.assert_equal(data['ft-m']['layer/est'], 2.)
+
+
+def test_assemble_data_ragged():
+    """[Metrics] assemble_data with unequal number of values per entry."""
+    d = [('est.0.%i' % i, {'score': s, 'pt': 1.}) for i, s in
+         enumerate([1., np.nan, 3.])]
+    d += [('est2.0.%i' % i, {'score': i, 'pt': None if i > 1 else 2.})
+          for i in range(1, 5)]
+    data = metrics.assemble_data(d)
+    np.testing.assert_equal(data['score-m']['est'], np.nan)
+    np.testing.assert_equal(data['score-s']['est'], np.nan)
+    np.testing.assert_equal(data['score-m']['est2'], 2.5)
+    np.testing.assert_equal(data['score-s']['est2'], np.std([1, 2, 3, 4]))
+    np.testing.assert_equal(data['pt-m']['est'], 1.)
+    np.testing.assert_equal(data['pt-m']['est2'], 2.)
+
+
+def test_assemble_data_array():
+    """[Metrics] assemble_data with array-valued scores."""
+    d = [('est.0.%i' % i, {'score': np.array([i, 2. * i]), 'pt': 1.})
+         for i in range(3)]
+    data = metrics.assemble_data(d)
+    s = [np.array([i, 2. * i]) for i in range(3)]
+    np.testing.assert_equal(data['score-m']['est'], np.mean(s))
+    np.testing.assert_equal(data['score-s']['est'], np.std(s))
+    np.testing.assert_equal(data['pt-m']['est'], 1.)
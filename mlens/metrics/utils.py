@@ -26,10 +26,32 @@ def _get_string(obj, dec):
         return obj.__str__()
 
 
-def _get_partitions(obj):
-    """Check if any entry has partitions"""
-    for name, _ in obj:
-        if int(name.split('.')[-2]) > 0:
+def _mean_std(values):
+    """Mean and standard deviation of each list of scores in values
+
+    All scores are stacked into one array. Lists of equal length are then
+    reduced row-wise together, which matches np.mean and np.std per list.
+    """
+    lengths = np.array([len(v) for v in values], dtype=np.int64)
+    scores = np.array([i for v in values for i in v], dtype=np.float64)
+    if scores.ndim != 1:
+        raise ValueError("Expected scalar values.")
+
+    starts = np.cumsum(lengths) - lengths
+    mean = np.empty(len(values))
+    std = np.empty(len(values))
+    for n in np.unique(lengths):
+        rows = np.flatnonzero(lengths == n)
+        block = scores[starts[rows, None] + np.arange(n)]
+        mean[rows] = block.mean(axis=1)
+        std[rows] = block.std(axis=1)
+    return mean, std
+
+
+def _get_partitions(keys):
+    """Check if any parsed entry name has partitions"""
+    for _, partition, _ in keys:
+        if int(partition) > 0:
             return True
     return False
 
@@ -223,55 +245,51 @@ def assemble_data(data_list):
     data = _dict()
     tmp = _dict()
 
-    partitions = _get_partitions(data_list)
+    # Names are either est.i.j or case.est.i.j, possibly with a prefix.
+    # Parse once into (prefix.case.est, i, j)
+    keys = [name.rsplit('.', 2) for name, _ in data_list]
+    partitions = _get_partitions(keys)
 
     # Collect scores per preprocessing case and estimator(s)
-    for name, data_dict in data_list:
+    for (name, partition, _), (_, data_dict) in zip(keys, data_list):
         if not data_dict:
             continue
 
-        prefix, name = _split(name, '/', a_s='/')
-
-        # Names are either est.i.j or case.est.i.j
-        splitted = name.split('.')
         if partitions:
-            name = tuple(splitted[:-1])
-
-            if len(name) == 3:
-                name = '%s.%s--%s' % name
-            else:
-                name = '%s--%s' % name
-        else:
-            name = '.'.join(splitted[:-2])
-
-        name = '%s%s' % (prefix, name)
-
-        if name not in tmp:
-            # Set up data struct for name
-            tmp[name] = _dict()
-            for k in data_dict.keys():
-                tmp[name][k] = list()
-                if '%s-m' % k not in data:
-                    data['%s-m' % k] = _dict()
-                    data['%s-s' % k] = _dict()
-                data['%s-m' % k][name] = list()
-                data['%s-s' % k][name] = list()
+            name = '%s--%s' % (name, partition)
 
         # collect all data dicts belonging to name
+        scores = tmp.setdefault(name, _dict())
         for k, v in data_dict.items():
-            tmp[name][k].append(v)
+            scores.setdefault(k, list()).append(v)
 
     # Aggregate to get mean and std
+    cells = list()
+    rows = list()
     for name, data_dict in tmp.items():
         for k, v in data_dict.items():
-            if not v:
-                continue
+            mean = data.setdefault('%s-m' % k, _dict())
+            std = data.setdefault('%s-s' % k, _dict())
+            mean[name] = list()
+            std[name] = list()
+
+            # Purge None values from the main est due to no predict times
+            v = [i for i in v if i is not None]
+            if v:
+                cells.append((k, mean, std, name))
+                rows.append(v)
+
+    try:
+        # Scalar scores are reduced together
+        for (_, mean, std, name), m, s in zip(cells, *_mean_std(rows)):
+            mean[name] = m
+            std[name] = s
+    except (TypeError, ValueError):
+        # Array-valued or non-numeric scores: aggregate list by list
+        for (k, mean, std, name), v in zip(cells, rows):
             try:
-                # Purge None values from the main est due to no predict times
-                v = [i for i in v if i is not None]
-                if v:
-                    data['%s-m' % k][name] = np.mean(v)
-                    data['%s-s' % k][name] = np.std(v)
+                mean[name] = np.mean(v)
+                std[name] = np.std(v)
             except Exception as exc:
                 warnings.warn(
                     "Aggregating data for %s failed. Raw data:\n%r\n"
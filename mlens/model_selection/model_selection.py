@@ -19,6 +19,7 @@ from ._base_functions import (parse_key, set_job, cat, check_scorer,
 from ..index import FoldIndex
 from ..parallel import ParallelEvaluation
 from ..parallel.base import BaseBackend, IndexMixin
+from ..parallel.learner import make_batches
 from ..metrics import Data, assemble_data
 from ..utils.formatting import _flatten, _check_instances
 from ..utils import print_time, safe_print, assert_correct_format
@@ -172,8 +173,14 @@ class BaseEval(IndexMixin, BaseBackend):
             generator = self._learners
             inp = 'main'
 
-        parallel(delayed(subtask, not _threading)()
-                 for task in generator for subtask in task(args, inp))
+        subtasks = (subtask for task in generator
+                    for subtask in task(args, inp))
+        if case != 'transformers':
+            # Evaluate estimators sharing preprocessing and folds in batches
+            n_jobs = parallel._effective_n_jobs()
+            subtasks = make_batches(subtasks, n_jobs)
+
+        parallel(delayed(subtask, not _threading)() for subtask in subtasks)
 
     def _fit(self, X, y, job):
         with ParallelEvaluation(self.backend, self.n_jobs) as manager:
@@ -10,7 +10,6 @@ from __future__ import division
 
 import os
 import warnings
-from scipy.sparse import issparse
 import numpy as np
 
 from ..utils import pickle_load, pickle_save, load as _load
@@ -148,71 +147,72 @@ def _safe_slice(array, idx):
     return array[idx]
 
 
+def build_index(idx, r=0):
+    """Build an index array from a sequence of ``(start, stop)`` tuples"""
+    # Vectorized concatenation of the ranges: offset each position in the
+    # output by the start of the range it falls in
+    bounds = np.asarray(idx, dtype=np.int64) - r
+    lengths = bounds[:, 1] - bounds[:, 0]
+    offsets = bounds[:, 0] - np.cumsum(lengths) + lengths
+    return np.repeat(offsets, lengths) + np.arange(lengths.sum())
+
+
+def _get_index(idx, r=0):
+    """Get a basic slice for a contiguous index, otherwise an index array"""
+    if isinstance(idx[0], tuple):
+        if all(idx[i][1] == idx[i + 1][0] for i in range(len(idx) - 1)):
+            # Adjacent (or a single) (start, stop) tuples form a slice
+            return slice(idx[0][0] - r, idx[-1][1] - r)
+        return build_index(idx, r)
+    return slice(idx[0] - r, idx[1] - r)
+
+
 def slice_array(x, y, idx, r=0):
-    """Build training array index and slice data."""
-    if idx == 'all':
+    """Build training array index and slice data.
+
+    ``idx`` is either ``None`` or ``'all'`` (no slicing), a ``(start, stop)``
+    tuple or a sequence of such tuples.
+
+    A ``(start, stop)`` tuple is sliced with basic slicing and returns a
+    view. Sequences of tuples return copies, so estimators that overwrite
+    their input do not alter the original data.
+    """
+    if not idx or idx == 'all':
         idx = None
+    elif isinstance(idx[0], tuple):
+        # Advanced indexing is required. This will trigger a copy
+        # of the slice in question to be made
+        idx = build_index(idx, r)
+    else:
+        idx = slice(idx[0] - r, idx[1] - r)
 
-    if idx:
-        # Check if the idx is a tuple and if so, whether it can be made
-        # into a simple slice
-        if isinstance(idx[0], tuple):
-            if len(idx[0]) > 1:
-                # Advanced indexing is required. This will trigger a copy
-                # of the slice in question to be made
-                simple_slice = False
-                idx = np.hstack([np.arange(t0 - r, t1 - r) for t0, t1 in idx])
-                x = _safe_slice(x, idx)
-                y = _safe_slice(y, idx)
-            else:
-                # The tuple is of the form ((a, b),) and can be made
-                # into a simple (a, b) tuple for which basic slicing applies
-                # which allows a view to be returned instead of a copy
-                simple_slice = True
-                idx = idx[0]
-        else:
-            # Index tuples of the form (a, b) allows simple slicing
-            simple_slice = True
-
-        if simple_slice:
-            x = x[slice(idx[0] - r, idx[1] - r)]
-            y = y[slice(idx[0] - r, idx[1] - r)] if y is not None else y
-
-    # Cast as ndarray to avoid passing memmaps to estimators
-    if y is not None and isinstance(y, np.memmap):
-        y = y.view(type=np.ndarray)
-    if not issparse(x) and isinstance(x, np.memmap):
+    if idx is not None:
+        x = _safe_slice(x, idx)
+        y = _safe_slice(y, idx)
+
+    # Cast as ndarray to avoid passing memmaps to estimators. Note that
+    # advanced indexing on a memmap also returns a (memory-backed) memmap.
+    # Other inputs (ndarrays, sparse matrices, None) are passed as is.
+    if isinstance(x, np.memmap):
         x = x.view(type=np.ndarray)
+    if isinstance(y, np.memmap):
+        y = y.view(type=np.ndarray)
 
     return x, y
 
 
 def assign_predictions(pred, p, tei, col, n):
     """Assign predictions to prediction array."""
-    if tei == 'all':
-        tei = None
-
-    if tei is None:
-        if len(p.shape) == 1:
-            pred[:, col] = p
-        else:
-            pred[:, col:(col + p.shape[1])] = p
-    else:
-        r = n - pred.shape[0]
+    r = n - pred.shape[0]
 
-        if isinstance(tei[0], tuple):
-            if len(tei) > 1:
-                idx = np.hstack([np.arange(t0 - r, t1 - r) for t0, t1 in tei])
-            else:
-                tei = tei[0]
-                idx = slice(tei[0] - r, tei[1] - r)
-        else:
-            idx = slice(tei[0] - r, tei[1] - r)
+    if tei is None or tei == 'all':
+        idx = slice(None)
+    else:
+        idx = _get_index(tei, r)
 
-        if len(p.shape) == 1:
-            pred[idx, col] = p
-        else:
-            pred[(idx, slice(col, col + p.shape[1]))] = p
+    # Column index for vector predictions, column slice for matrices
+    cols = col if p.ndim == 1 else slice(col, col + p.shape[1])
+    pred[idx, cols] = p
 
 
 def score_predictions(y, p, scorer, name, inst_name):
@@ -227,8 +227,25 @@ def score_predictions(y, p, scorer, name, inst_name):
     return s
 
 
-def transform(tr, x, y):
-    """Try transforming with X and y. Else, transform with only X."""
+def _accepts_copy(tr):
+    """Check if the transform method of a transformer has a copy argument"""
+    func = getattr(tr.transform, '__func__', tr.transform)
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return False
+    n_args = code.co_argcount + getattr(code, 'co_kwonlyargcount', 0)
+    return 'copy' in code.co_varnames[:n_args]
+
+
+def transform(tr, x, y, copy=True):
+    """Try transforming with X and y. Else, transform with only X.
+
+    If ``copy=False``, ``x`` is owned by the caller and is transformed
+    in-place by transformers whose ``transform`` accepts a ``copy`` argument.
+    """
+    if not copy and _accepts_copy(tr):
+        return tr.transform(x, copy=False), y
+
     try:
         x = tr.transform(x)
     except TypeError:
@@ -237,6 +254,20 @@ def transform(tr, x, y):
     return x, y
 
 
+def fit_transform(tr, x, y):
+    """Fit and transform in one pass if supported.
+
+    Ensembles in model selection mode can truncate y on transform and are
+    fitted and transformed separately.
+    """
+    if (hasattr(tr, 'fit_transform') and
+            not getattr(tr, 'model_selection', False)):
+        return tr.fit_transform(x, y), y
+
+    tr.fit(x, y)
+    return transform(tr, x, y)
+
+
 def check_params(lpar, rpar):
     """Check parameter overlap
 
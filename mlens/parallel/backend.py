@@ -24,7 +24,7 @@ import warnings
 from abc import ABCMeta, abstractmethod
 
 import numpy as np
-from scipy.sparse import issparse, hstack
+from scipy.sparse import issparse, isspmatrix_csr, hstack
 
 from .. import config
 from ..externals.joblib import Parallel, dump, load
@@ -175,7 +175,7 @@ class Job(object):
     """
 
     __slots__ = ['targets', 'predict_in', 'predict_out', 'dir', 'job', 'tmp',
-                 '_n_dir', 'kwargs', 'stack', 'split']
+                 '_n_dir', '_n_shuffle', 'kwargs', 'stack', 'split']
 
     def __init__(self, job, stack, split, dir=None, tmp=None, predict_in=None,
                  targets=None, predict_out=None):
@@ -189,6 +189,7 @@ class Job(object):
         self.tmp = tmp
         self.dir = dir
         self._n_dir = 0
+        self._n_shuffle = 0
 
     def clear(self):
         """Clear output data for new task"""
@@ -204,7 +205,7 @@ class Job(object):
         if self.predict_out is None:
             return
         if (issparse(self.predict_out) and not
-                self.predict_out.__class__.__name__.startswith('csr')):
+                isspmatrix_csr(self.predict_out)):
             # Enforce csr on spare matrices
             self.predict_out = self.predict_out.tocsr()
 
@@ -246,8 +247,24 @@ class Job(object):
         """
         r = check_random_state(random_state)
         idx = r.permutation(self.targets.shape[0])
-        self.predict_in = self.predict_in[idx]
-        self.targets = self.targets[idx]
+
+        # Unique file names: previous shuffles may still be memory-mapped
+        self._n_shuffle += 1
+        self.predict_in = self._permute(
+            self.predict_in, idx, 'X_shuffled_%i' % self._n_shuffle)
+        self.targets = self._permute(
+            self.targets, idx, 'y_shuffled_%i' % self._n_shuffle)
+
+    def _permute(self, array, idx, name):
+        """Permute array, keeping memory-mapped arrays memory-mapped."""
+        memmapped = isinstance(array, np.memmap)
+        array = array[idx]
+        if memmapped and isinstance(self.dir, str):
+            # Indexing loads the array into memory. Persist the permuted
+            # array so that workers are passed a reference to the file
+            # instead of a pickled copy of the array for every task.
+            array = _load_mmap(dump_array(np.asarray(array), name, self.dir))
+        return array
 
     def subdir(self):
         """Return a cache subdirectory
@@ -35,6 +35,22 @@ from ._base_functions import check_stack, check_params
 from .. import config
 from ..utils.exceptions import ParallelProcessingError
 from ..externals.sklearn.base import clone, BaseEstimator as _BaseEstimator
+try:
+    from functools import lru_cache
+except ImportError:
+    from ..externals.fixes import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _setup_functions(cls):
+    """Sorted setup methods of a class and their argument names"""
+    funs = list()
+    for f in sorted(dir(cls)):
+        if f.startswith('_setup_'):
+            func = getattr(cls, f)
+            code = getattr(func, '__func__', func).__code__
+            funs.append((f, frozenset(code.co_varnames[:code.co_argcount])))
+    return funs
 
 
 class ParamMixin(_BaseEstimator, object):
@@ -221,6 +237,10 @@ class BaseBackend(object):
         yield
 
 
+_BACKEND_PARAMS = [name for name in BaseBackend.__init__.__code__.co_varnames
+                   if name not in ['self']]
+
+
 class BaseParallel(BaseBackend):
 
     """Base class for parallel objects
@@ -267,14 +287,11 @@ class BaseParallel(BaseBackend):
     def setup(self, X, y, job, skip=None, **kwargs):
         """Setup instance for estimation"""
         skip = ['_setup_%s' % s for s in skip] if skip else []
-        funs = [f for f in dir(self)
-                if f.startswith('_setup_') and f not in skip]
-
-        for f in sorted(funs):
-            func = getattr(self, f)
-            args = func.__func__.__code__.co_varnames
-            fargs = {k: v for k, v in kwargs.items() if k in args}
-            func(X, y, job, **fargs)
+        for f, args in _setup_functions(self.__class__):
+            if f in skip:
+                continue
+            fargs = {k: kwargs[k] for k in args.intersection(kwargs)}
+            getattr(self, f)(X, y, job, **fargs)
 
 
 class BaseEstimator(ParamMixin, _BaseEstimator, BaseParallel):
@@ -292,9 +309,8 @@ class BaseEstimator(ParamMixin, _BaseEstimator, BaseParallel):
 
     def get_params(self, deep=True):
         out = super(BaseEstimator, self).get_params(deep=deep)
-        for name in BaseBackend.__init__.__code__.co_varnames:
-            if name not in ['self']:
-                out[name] = getattr(self, name)
+        for name in _BACKEND_PARAMS:
+            out[name] = getattr(self, name)
         return out
 
     @property
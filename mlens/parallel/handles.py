@@ -6,9 +6,11 @@
 
 Handles for mlens.parallel.
 """
+import numpy as np
+
 from .base import BaseEstimator
 from .learner import Learner, Transformer
-from ._base_functions import mold_objects, transform
+from ._base_functions import mold_objects, transform, fit_transform
 from ..utils import format_name, check_instances
 from ..utils.formatting import _check_instances
 from ..externals.sklearn.base import clone, BaseEstimator as _BaseEstimator
@@ -61,12 +63,23 @@ class Pipeline(_BaseEstimator):
             self._pipeline = [(tr_name, clone(tr))
                               for tr_name, tr in self.pipeline]
 
+        # Intermediate arrays are owned by the pipeline and can be
+        # transformed in-place; the input array is never modified. An output
+        # that does not share memory with the input is assumed to be a new
+        # array, i.e. not one the transformer keeps a reference to.
+        X_in, copy = X, True
         for tr_name, tr in self._pipeline:
-            if fit:
+            if len(self._pipeline) == 1 and not process:
                 tr.fit(X, y)
+                continue
 
-            if len(self._pipeline) > 1 or process:
-                X, y = transform(tr, X, y)
+            if fit:
+                X, y = fit_transform(tr, X, y)
+            else:
+                X, y = transform(tr, X, y, copy)
+                copy = not (isinstance(X, np.ndarray) and
+                            isinstance(X_in, np.ndarray) and
+                            not np.may_share_memory(X, X_in))
 
         if process:
             if self.return_y:
@@ -14,7 +14,8 @@ Layer module.
 from __future__ import division, print_function
 
 from .base import OutputMixin, IndexMixin, BaseStacker
-from ..utils import time, print_time, safe_print, format_name
+from .learner import make_batches
+from ..utils import format_name, _Timed
 from ..utils.exceptions import NotFittedError
 from ..externals.joblib import delayed
 from ..metrics import Data
@@ -122,46 +123,35 @@ class Layer(OutputMixin, IndexMixin, BaseStacker):
             raise NotFittedError(
                 "Layer instance (%s) not fitted." % self.name)
 
-        if self.verbose:
-            msg = "{:<30}"
-            f = "stdout" if self.verbose < 10 else "stderr"
-            e1 = ' ' if self.verbose <= 1 else "\n"
-            e2 = ' ' if self.verbose <= 2 else "\n"
-            safe_print(msg.format('Processing %s' % self.name),
-                       file=f, end=e1)
-            t0 = time()
-
-        if self.transformers:
-            if self.verbose >= 2:
-                safe_print(msg.format('Preprocess pipelines ...'),
-                           file=f, end=e2)
-                t1 = time()
-
-            parallel(delayed(subtransformer, not _threading)()
-                     for transformer in self.transformers
-                     for subtransformer in transformer(args, 'auxiliary'))
-
-            if self.verbose >= 2:
-                print_time(t1, 'done', file=f)
-
-        if self.verbose >= 2:
-            safe_print(msg.format('Learners ...'), file=f, end=e2)
-            t1 = time()
-
-        parallel(delayed(sublearner, not _threading)()
-                 for learner in self.learners
-                 for sublearner in learner(args, 'main'))
-
-        if self.verbose >= 2:
-            print_time(t1, 'done', file=f)
-
-        if job == 'fit':
-            self.collect()
-
-        if self.verbose:
-            msg = "done" if self.verbose == 1 \
-                else (msg + " {}").format(self.name, "done")
-            print_time(t0, msg, file=f)
+        msg = "{:<30}"
+        f = "stdout" if self.verbose < 10 else "stderr"
+        e1 = ' ' if self.verbose <= 1 else "\n"
+        e2 = ' ' if self.verbose <= 2 else "\n"
+        done = "done" if self.verbose == 1 \
+            else (msg + " {}").format(self.name, "done")
+
+        with _Timed(self.verbose, done, msg.format('Processing %s' %
+                                                   self.name), e1, file=f):
+            if self.transformers:
+                with _Timed(self.verbose >= 2, 'done',
+                            msg.format('Preprocess pipelines ...'), e2,
+                            file=f):
+                    parallel(delayed(subtransformer, not _threading)()
+                             for transformer in self.transformers
+                             for subtransformer in transformer(args,
+                                                               'auxiliary'))
+
+            with _Timed(self.verbose >= 2, 'done',
+                        msg.format('Learners ...'), e2, file=f):
+                # Sub-learners sharing preprocessing and folds are batched
+                parallel(delayed(batch, not _threading)()
+                         for batch in make_batches(
+                             (sublearner for learner in self.learners
+                              for sublearner in learner(args, 'main')),
+                             parallel._effective_n_jobs()))
+
+            if job == 'fit':
+                self.collect()
 
     def collect(self, path=None):
         """Collect cache estimators"""
@@ -28,6 +28,10 @@ from ..utils.exceptions import (NotFittedError, FitFailedWarning,
 
 from ..externals.sklearn.base import clone
 from ..externals.joblib.parallel import delayed
+try:
+    from collections import OrderedDict as _dict
+except ImportError:
+    _dict = dict
 try:
     from time import perf_counter as time
 except ImportError:
@@ -119,10 +123,18 @@ class SubLearner(object):
         else:
             self.processing_index = ''
 
+        # Shared pipeline load when run as part of a SubLearnerBatch
+        self._memo = None
+
     def __call__(self):
         """Launch job"""
         return getattr(self, self.job)()
 
+    @property
+    def batch_key(self):
+        """Key of sub-learners that share a preprocessing pipeline"""
+        return self.job, self.preprocess, self.index
+
     def fit(self, path=None):
         """Fit sub-learner"""
         if path is None:
@@ -182,7 +194,12 @@ class SubLearner(object):
     def _load_preprocess(self, path):
         """Load preprocessing pipeline"""
         if self.preprocess is not None:
+            if self._memo is not None and 'preprocess' in self._memo:
+                return self._memo['preprocess']
+
             obj = load(path, self.preprocess_index, self.raise_on_exception)
+            if self._memo is not None:
+                self._memo['preprocess'] = obj.estimator
             return obj.estimator
         return
 
@@ -394,6 +411,58 @@ class EvalSubLearner(SubLearner):
         return out
 
 
+class SubLearnerBatch(object):
+
+    """Batch of sub-learners sharing a preprocessing pipeline
+
+    Runs a set of sub-learners as a single task. The preprocessing pipeline
+    is loaded once for the batch rather than once per sub-learner. Each
+    sub-learner slices and transforms its own input.
+    """
+
+    def __init__(self, sublearners):
+        self.sublearners = sublearners
+
+    def __call__(self):
+        """Launch jobs"""
+        memo = dict()
+        out = list()
+        for sublearner in self.sublearners:
+            sublearner._memo = memo
+            try:
+                out.append(sublearner())
+            finally:
+                sublearner._memo = None
+        return out
+
+
+def make_batches(subtasks, n_jobs=1):
+    """Group sub-learners into batches that share a preprocessing pipeline
+
+    Sub-learners with the same :attr:`SubLearner.batch_key` are grouped
+    together. Groups are split so that at least ``n_jobs`` batches are
+    generated whenever there are at least ``n_jobs`` sub-learners.
+
+    Parameters
+    ----------
+    subtasks : iterable
+        generator of :class:`SubLearner` instances.
+
+    n_jobs : int (default = 1)
+        number of workers available to process batches.
+    """
+    groups = _dict()
+    n_subtasks = 0
+    for subtask in subtasks:
+        groups.setdefault(subtask.batch_key, list()).append(subtask)
+        n_subtasks += 1
+
+    size = max(1, -(-n_subtasks // max(n_jobs, 1)))
+    for group in groups.values():
+        for i in range(0, len(group), size):
+            yield SubLearnerBatch(group[i:i + size])
+
+
 class Cache(object):
 
     """Cache wrapper for IndexedEstimator
@@ -688,11 +757,12 @@ class BaseNode(OutputMixin, IndexMixin, BaseEstimator):
         learner_data = list()
         sublearner_files = list()
         sublearner_data = list()
-        while files:
-            f = files.pop(0)
-            if f in files:
+        seen = set()
+        for f in files:
+            if id(f) in seen:
                 raise ParallelProcessingError(
                     "Corrupt cache: duplicate cache entry found.\n%r" % f)
+            seen.add(id(f))
 
             if f.index[1] == 0:
                 learner_files.append(f)
@@ -0,0 +1,49 @@
+"""ML-ENSEMBLE
+
+Testing suite for the job backend
+"""
+import os
+import shutil
+import tempfile
+import numpy as np
+from mlens.index import FoldIndex
+from mlens.parallel import Layer, make_group, run
+from mlens.parallel.backend import Job, dump_array, _load_mmap
+from mlens.utils.dummy import OLS
+
+X = np.arange(24, dtype=np.float64).reshape(12, 2)
+y = np.arange(12, dtype=np.float64)
+
+
+def test_shuffle_memmap():
+    """[Parallel | Backend] test shuffled memmaps persist to unique files"""
+    path = tempfile.mkdtemp()
+    try:
+        job = Job('fit', False, False, dir=path,
+                  predict_in=_load_mmap(dump_array(X, 'X', path)),
+                  targets=_load_mmap(dump_array(y, 'y', path)))
+
+        files = set()
+        for seed in range(2):
+            job.shuffle(seed)
+            assert isinstance(job.predict_in, np.memmap)
+            assert isinstance(job.targets, np.memmap)
+            files.update([job.predict_in.filename, job.targets.filename])
+            np.testing.assert_array_equal(job.predict_in[:, 0],
+                                          2 * job.targets)
+
+        assert len(files) == 4
+        assert all(os.path.exists(f) for f in files)
+    finally:
+        shutil.rmtree(path)
+
+
+def test_shuffle_backends():
+    """[Parallel | Backend] test shuffle under thread and process backends"""
+    out = list()
+    for backend in ['threading', 'multiprocessing']:
+        group = make_group(FoldIndex(2), [OLS(), OLS(1)], None)
+        layer = Layer(stack=group, shuffle=True, random_state=1,
+                      backend=backend)
+        out.append(run(layer, 'fit', X, y, return_preds=True))
+    np.testing.assert_array_equal(*out)
@@ -3,7 +3,104 @@
 Test base functions used by sublearners
 """
 import os
+import shutil
+import tempfile
 import numpy as np
-from mlens.parallel._base_functions import slice_array,  assign_predictions
+from mlens.parallel._base_functions import (
+    slice_array, assign_predictions, build_index, transform)
 
-# TODO: Write tests
+X = np.arange(24).reshape(12, 2)
+y = np.arange(12)
+
+
+def test_build_index():
+    """[Parallel | Base functions] test build_index index array"""
+    idx = build_index([(0, 2), (6, 8)])
+    np.testing.assert_array_equal(idx, np.array([0, 1, 6, 7]))
+
+
+def test_slice_array_tuples():
+    """[Parallel | Base functions] test slice_array on index tuples"""
+    x, z = slice_array(X, y, ((0, 2), (6, 8)))
+    np.testing.assert_array_equal(z, np.array([0, 1, 6, 7]))
+    np.testing.assert_array_equal(x, X[[0, 1, 6, 7]])
+
+    x, z = slice_array(X, y, (4, 6))
+    np.testing.assert_array_equal(z, np.array([4, 5]))
+
+
+def test_assign_predictions():
+    """[Parallel | Base functions] test assign_predictions"""
+    P = np.zeros((12, 3))
+    assign_predictions(P, np.ones(4), ((0, 2), (6, 8)), 0, 12)
+    assign_predictions(P, np.ones((2, 2)), (4, 6), 1, 12)
+    np.testing.assert_array_equal(P[:, 0], (np.in1d(y, [0, 1, 6, 7])))
+    np.testing.assert_array_equal(P[4:6, 1:], np.ones((2, 2)))
+    assert P[:, 1:].sum() == 4
+
+
+def test_slice_array_copy():
+    """[Parallel | Base functions] test slice_array copies tuple sequences"""
+    x, z = slice_array(X, y, ((0, 2), (2, 5)))
+    np.testing.assert_array_equal(z, np.arange(5))
+    assert not np.may_share_memory(x, X)
+
+    x, z = slice_array(X, y, ((4, 8),))
+    np.testing.assert_array_equal(z, np.arange(4, 8))
+    assert not np.may_share_memory(x, X)
+
+    x, z = slice_array(X, y, (4, 8))
+    np.testing.assert_array_equal(z, np.arange(4, 8))
+    assert np.may_share_memory(x, X)
+
+
+def test_assign_predictions_contiguous():
+    """[Parallel | Base functions] test assign_predictions on adjacent folds"""
+    P = np.zeros((12, 1))
+    assign_predictions(P, np.ones(5), ((0, 2), (2, 5)), 0, 12)
+    np.testing.assert_array_equal(P[:, 0], np.arange(12) < 5)
+
+
+def test_build_index_ranges():
+    """[Parallel | Base functions] test build_index against np.hstack"""
+    idx = ((1, 4), (4, 4), (7, 12), (20, 21))
+    np.testing.assert_array_equal(
+        build_index(idx, 1),
+        np.hstack([np.arange(t0 - 1, t1 - 1) for t0, t1 in idx]))
+
+
+def test_slice_array_memmap():
+    """[Parallel | Base functions] test slice_array detaches memmaps"""
+    path = tempfile.mkdtemp()
+    try:
+        f = os.path.join(path, 'X.mmap')
+        Z = np.memmap(f, dtype=X.dtype, mode='w+', shape=X.shape)
+        Z[:] = X
+        for idx in [(0, 4), ((0, 2), (6, 8))]:
+            x, _ = slice_array(Z, None, idx)
+            assert type(x) is np.ndarray
+        del Z, x
+    finally:
+        shutil.rmtree(path)
+
+
+class _FailInplace(object):
+
+    """Transformer that fails after overwriting its input in-place"""
+
+    def transform(self, X, copy=True):
+        if not copy:
+            X += 1
+            raise TypeError("Failed mid-transform.")
+        return X + 1
+
+
+def test_transform_no_retry():
+    """[Parallel | Base functions] test failed in-place transform not retried"""
+    Z = X.astype(np.float64)
+    with np.testing.assert_raises(TypeError):
+        transform(_FailInplace(), Z, y, copy=False)
+    np.testing.assert_array_equal(Z, X + 1)
+
+    x, _ = transform(_FailInplace(), Z, y)
+    np.testing.assert_array_equal(x, X + 2)
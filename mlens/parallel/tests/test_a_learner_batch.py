@@ -0,0 +1,85 @@
+"""ML-ENSEMBLE
+
+Testing suite for batched sub-learner dispatch
+"""
+import numpy as np
+from mlens.index import FoldIndex
+from mlens.parallel import Layer, make_group, run
+from mlens.parallel.learner import SubLearnerBatch, make_batches
+from mlens.utils.dummy import OLS, Scale
+
+
+class _Task(object):
+
+    """Minimal sub-learner stand-in"""
+
+    def __init__(self, key):
+        self.batch_key = key
+        self._memo = None
+        self.memo = None
+
+    def __call__(self):
+        self.memo = self._memo
+        self._memo.setdefault('preprocess', list()).append(self.batch_key)
+        return self.batch_key
+
+
+class _Overwrite(OLS):
+
+    """OLS that zeroes its input after fitting and predicting"""
+
+    def fit(self, X, y):
+        super(_Overwrite, self).fit(X, y)
+        X *= 0
+        return self
+
+    def predict(self, X):
+        p = super(_Overwrite, self).predict(X)
+        X *= 0
+        return p
+
+
+def test_make_batches_groups():
+    """[Parallel | Batch] test make_batches groups on batch keys"""
+    tasks = [_Task(k) for k in ['a', 'b', 'a', 'b', 'c']]
+    batches = list(make_batches(iter(tasks)))
+    assert [[t.batch_key for t in b.sublearners] for b in batches] == \
+        [['a', 'a'], ['b', 'b'], ['c']]
+
+
+def test_make_batches_n_jobs():
+    """[Parallel | Batch] test make_batches splits groups over n_jobs"""
+    tasks = [_Task('a') for _ in range(5)]
+    batches = list(make_batches(iter(tasks), n_jobs=2))
+    assert [len(b.sublearners) for b in batches] == [3, 2]
+
+    batches = list(make_batches(iter(tasks), n_jobs=10))
+    assert [len(b.sublearners) for b in batches] == [1] * 5
+
+
+def test_batch_memo():
+    """[Parallel | Batch] test sub-learners in a batch share one memo"""
+    tasks = [_Task('a') for _ in range(3)]
+    assert SubLearnerBatch(tasks)() == ['a'] * 3
+    assert all(t.memo is tasks[0].memo for t in tasks)
+    assert tasks[0].memo['preprocess'] == ['a'] * 3
+    assert all(t._memo is None for t in tasks)
+
+    other = _Task('a')
+    SubLearnerBatch([other])()
+    assert other.memo is not tasks[0].memo
+
+
+def test_batch_isolation():
+    """[Parallel | Batch] test estimators overwriting input do not leak"""
+    X = np.arange(60, dtype=np.float64).reshape(20, 3) ** 0.5
+    y = X.sum(axis=1)
+
+    def fit(estimators):
+        group = make_group(
+            FoldIndex(2), {'pr': estimators}, {'pr': [Scale()]})
+        return run(Layer(stack=group), 'fit', X, y, return_preds=True)
+
+    alone = fit([('b', OLS())])
+    batched = fit([('a', _Overwrite()), ('b', OLS())])
+    np.testing.assert_array_equal(batched[:, 1], alone[:, 0])
@@ -185,3 +185,26 @@ def test_run_predict():
     _run(group, 'fit', X, y)
     A = _run(group, 'predict', X)
     np.testing.assert_array_equal(A, P)
+
+
+class _InplaceScale(Scale):
+
+    """Scale that subtracts the mean in-place when asked to."""
+
+    def transform(self, X, copy=True):
+        if copy:
+            return super(_InplaceScale, self).transform(X)
+        X -= self.mean_
+        return X
+
+
+def test_pipeline_inplace():
+    """[Parallel | Pipeline] test only intermediate arrays are overwritten"""
+    Z = X.copy()
+    pipe = Pipeline([_InplaceScale(), _InplaceScale(), _InplaceScale()])
+    pipe.fit(Z)
+    H = pipe.transform(Z)
+    G = Pipeline([Scale(), Scale(), Scale()]).fit_transform(X)
+
+    np.testing.assert_array_equal(Z, X)
+    np.testing.assert_array_almost_equal(H, G)
@@ -404,7 +404,7 @@ class Data(object):
                     F[fix, col_id['%s-%s-%s' % (i, key, est_name)]] = p
                 else:
                     c = col_id['%s-%s-%s' % (i, key, est_name)]
-                    F[np.ix_(fix, np.arange(c, c + labels))] = p
+                    F[fix, c:c + labels] = p
 
         return F, weights
 
@@ -7,8 +7,8 @@
 
 from .id_train import IdTrain
 from .utils import (
-    pickle_save, pickle_load, load, time, print_time, safe_print, CMLog,
-    kwarg_parser, clone_attribute)
+    pickle_save, pickle_load, load, time, print_time, safe_print, _Timed,
+    CMLog, kwarg_parser, clone_attribute)
 
 from .formatting import check_instances, format_name
 from .checks import (
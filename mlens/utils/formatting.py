@@ -207,13 +207,13 @@ def check_instances(estimators=None, preprocessing=None, namespace=None):
         estimators = _check_instances(estimators, namespace=namespace)
         estimators = _flatten(estimators)
 
-    out_prep, out_est, cases = list(), list(), list()
+    out_prep, out_est, cases = list(), list(), set()
     if preprocessing:
         for preprocess_name, tr in sorted(preprocessing):
             if tr:
                 out_prep.append((preprocess_name,
                                  [(n, clone(t)) for n, t in tr]))
-                cases.append(preprocess_name)
+                cases.add(preprocess_name)
     if estimators:
         for preprocess_name, learner_name, est in estimators:
             pr_name = preprocess_name if preprocess_name in cases else None
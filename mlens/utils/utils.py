@@ -47,7 +47,7 @@ def pickled(name):
 def pickle_save(obj, name):
     """Utility function for pickling an object"""
     with open(pickled(name), 'wb') as f:
-        pickle.dump(obj, f)
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def pickle_load(name):
@@ -70,13 +70,13 @@ def load(file, enforce_filetype=True):
             "for %i seconds before aborting. " % (file, s, lim),
             ParallelProcessingWarning)
 
-        ts = time()
+        deadline = time() + lim
         while not os.path.exists(file):
-            sleep(s)
-            if time() - ts > lim:
+            if time() > deadline:
                 raise ParallelProcessingError(
                     "Could not load transformer at %s\nDetails:\n%r" %
-                    (dir, msg))
+                    (file, msg))
+            sleep(s)
 
         return pickle_load(file)
 
@@ -128,6 +128,36 @@ def print_time(t0, message='', **kwargs):
     safe_print(message + '%02d:%02d:%02d' % (h, m, s), **kwargs)
 
 
+class _Timed(object):
+
+    """Context manager for timing a job if verbose.
+
+    Prints ``start`` on entry and the elapsed time with ``message`` on a
+    successful exit. No-op if ``verbose`` evaluates to ``False``.
+    """
+
+    __slots__ = ['verbose', 'message', 'start', 'end', 'kwargs', 't0']
+
+    def __init__(self, verbose, message='', start=None, end='\n', **kwargs):
+        self.verbose = verbose
+        self.message = message
+        self.start = start
+        self.end = end
+        self.kwargs = kwargs
+        self.t0 = None
+
+    def __enter__(self):
+        if self.verbose:
+            if self.start is not None:
+                safe_print(self.start, end=self.end, **self.kwargs)
+            self.t0 = time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.verbose and exc_type is None:
+            print_time(self.t0, self.message, **self.kwargs)
+
+
 class CMLog(object):
 
     """CPU and Memory logger.